@@ -1,10 +1,11 @@
 import sys
 import os
 
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, request, jsonify  # noqa: E402
-from flask_cors import CORS  # noqa: E402
 from src.code_reviewer import CodeReviewer  # noqa: E402
 
 app = Flask(__name__)
@@ -3,7 +3,7 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeIssue:
     severity: str
     line: int
@@ -11,7 +11,7 @@ class CodeIssue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     score: float
     issues: List[CodeIssue]
@@ -22,22 +22,26 @@ class ReviewResult:
 class CodeReviewer:
     def __init__(self):
         self.complexity_patterns = [
-            r"\bif\s+",
-            r"\bfor\s+",
-            r"\bwhile\s+",
-            r"\btry\s*:",
-            r"\bexcept\s+",
-            r"\bswitch\s+",
-            r"\bcase\s+",
+            re.compile(r"\bif\s+"),
+            re.compile(r"\bfor\s+"),
+            re.compile(r"\bwhile\s+"),
+            re.compile(r"\btry\s*:"),
+            re.compile(r"\bexcept\s+"),
+            re.compile(r"\bswitch\s+"),
+            re.compile(r"\bcase\s+"),
         ]
 
         self.smell_patterns = [
-            (r"def\s+\w+\([^)]*\):\s*pass", "Empty function detected"),
-            (r"print\s*\(", "Debug print statement found"),
-            (r"todo|fixme|hack|xxx", "TODO/FIXME comment found", re.IGNORECASE),
-            (r"\.\.\.", "Ellipsis placeholder found"),
+            (re.compile(r"def\s+\w+\([^)]*\):\s*pass"), "Empty function detected"),
+            (re.compile(r"print\s*\("), "Debug print statement found"),
+            (re.compile(r"todo|fixme|hack|xxx", re.IGNORECASE), "TODO/FIXME comment found"),
+            (re.compile(r"\.\.\."), "Ellipsis placeholder found"),
         ]
 
+        self.password_pattern = re.compile(r'\bpassword\s*=\s*["\']', re.IGNORECASE)
+
+        self.severity_penalties = {"error": 10, "warning": 5, "info": 1}
+
     def review_code(self, content: str, language: str = "python") -> ReviewResult:
         lines = content.split("\n")
         issues = []
@@ -92,9 +96,8 @@ class CodeReviewer:
                 )
             )
 
-        for pattern, message, *flags in self.smell_patterns:
-            flag = flags[0] if flags else 0
-            if re.search(pattern, line, flag):
+        for pattern, message in self.smell_patterns:
+            if pattern.search(line):
                 issues.append(
                     CodeIssue(
                         severity="warning",
@@ -104,7 +107,7 @@ class CodeReviewer:
                     )
                 )
 
-        if re.search(r'\bpassword\s*=\s*["\']', line, re.IGNORECASE):
+        if self.password_pattern.search(line):
             issues.append(
                 CodeIssue(
                     severity="error",
@@ -117,11 +120,7 @@ class CodeReviewer:
         return issues
 
     def _count_complexity(self, line: str) -> int:
-        count = 0
-        for pattern in self.complexity_patterns:
-            if re.search(pattern, line):
-                count += 1
-        return count
+        return sum(1 for pattern in self.complexity_patterns if pattern.search(line))
 
     def _calculate_complexity_score(self, complexity_count: int, total_lines: int) -> float:
         if total_lines == 0:
@@ -132,13 +131,11 @@ class CodeReviewer:
     def _calculate_score(self, issues: List[CodeIssue], complexity_score: float) -> float:
         base_score = 100.0
 
-        error_penalty = sum(10 for issue in issues if issue.severity == "error")
-        warning_penalty = sum(5 for issue in issues if issue.severity == "warning")
-        info_penalty = sum(1 for issue in issues if issue.severity == "info")
+        issue_penalty = sum(self.severity_penalties.get(issue.severity, 0) for issue in issues)
 
         complexity_penalty = complexity_score * 20
 
-        score = base_score - error_penalty - warning_penalty - info_penalty - complexity_penalty
+        score = base_score - issue_penalty - complexity_penalty
 
         return max(0.0, min(100.0, score))
 
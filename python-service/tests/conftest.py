@@ -0,0 +1,10 @@
+import pytest
+from src.app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    app.config["TESTING"] = True
+    app.json.sort_keys = False
+    app.json.compact = True
+    return app.test_client(use_cookies=False)
@@ -1,12 +1,4 @@
 import pytest
-from src.app import app
-
-
-@pytest.fixture
-def client():
-    app.config["TESTING"] = True
-    with app.test_client() as client:
-        yield client
 
 
 def test_health_check(client):
@@ -27,9 +19,18 @@ def test_review_code(client):
     assert "issues" in data
 
 
-def test_review_code_missing_content(client):
-    response = client.post("/review", json={})
+@pytest.mark.parametrize(
+    "endpoint,expected_error",
+    [
+        ("/review", "Missing 'content' field"),
+        ("/review/function", "Missing 'function_code' field"),
+    ],
+)
+def test_missing_field_returns_400(client, endpoint, expected_error):
+    response = client.post(endpoint, json={})
     assert response.status_code == 400
+    data = response.get_json()
+    assert data["error"] == expected_error
 
 
 def test_review_function(client):
@@ -2,8 +2,9 @@ from src.code_reviewer import CodeReviewer
 
 
 class TestCodeReviewer:
-    def setup_method(self):
-        self.reviewer = CodeReviewer()
+    @classmethod
+    def setup_class(cls):
+        cls.reviewer = CodeReviewer()
 
     def test_review_simple_code(self):
         code = """def hello():